@@ -12,18 +12,39 @@ NO Perplexity API dependency. All data comes from structured sources.
 """
 
 import os
+import hashlib
 import json
 import re
 import sys
+import threading
 import traceback
 from datetime import datetime, timezone, timedelta
+from string import Formatter
+
+try:
+    # Optional: ~2-3x faster than stdlib json on the MB-sized Wikipedia payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 WIKI_API = 'https://en.wikipedia.org/w/api.php'
+WIKI_CACHE_DIR = os.path.join('.cache', 'wiki')
+YOUTUBE_CACHE_FILE = os.path.join('.cache', 'youtube.json')
+YOUTUBE_CACHE_MAX_AGE = timedelta(hours=2)
 YOUTUBE_API_KEY = os.environ.get('YOUTUBE_API_KEY', '')
 MST = timezone(timedelta(hours=-7))
 GAMES_START = datetime(2026, 2, 6, tzinfo=MST)
 GAMES_END = datetime(2026, 2, 22, 23, 59, 59, tzinfo=MST)
 
+# Compiled once; applied to every table cell the scrapers read.
+# Footnote markers like [a] or [1], plus a trailing host-nation '*' even when
+# footnotes follow it ("Italy*[a]"), removed in a single pass.
+_RE_CELL_NOISE = re.compile(r'\[.*?\]|\*(?=(?:\s|\[[^\]\n]*\])*$)')
+
+# Cache-file name slug, and the 11-char video id in any YouTube URL form
+_RE_NON_WORD = re.compile(r'\W+')
+_RE_YOUTUBE_ID = re.compile(r'(?:v=|youtu\.be/|embed/|shorts/)([a-zA-Z0-9_-]{11})')
+
 # Country code to flag emoji mapping
 COUNTRY_FLAGS = {
     'Norway': '\U0001f1f3\U0001f1f4', 'Italy': '\U0001f1ee\U0001f1f9',
@@ -61,6 +82,12 @@ COUNTRY_CODES = {
     'Belarus': 'BLR', 'Liechtenstein': 'LIE', 'Andorra': 'AND', 'Mongolia': 'MGL',
 }
 
+# name -> (flag, code), so each scraped row needs one lookup instead of two
+_COUNTRY_INFO = {
+    name: (COUNTRY_FLAGS.get(name, ''), COUNTRY_CODES.get(name, name[:3].upper()))
+    for name in COUNTRY_FLAGS.keys() | COUNTRY_CODES.keys()
+}
+
 
 # ── Hardcoded Authoritative Data ─────────────────────────────────────────
 # Last-resort fallbacks if ALL scrapers fail. Updated Feb 18, Day 13.
@@ -131,12 +158,99 @@ FALLBACK_ATHLETES = {
 }
 
 
+# ── HTTP Session ──────────────────────────────────────────────────────────
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _http_session():
+    """Shared requests.Session so every scraper reuses keep-alive connections
+    and retries transient errors (429/5xx) with backoff."""
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    # The fetchers in main() start together on worker threads; without the
+    # lock each could build its own session and its own connection pool
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            return _SESSION
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                              max_retries=retry))
+        session.headers.update({'User-Agent': 'OlympicsDashboard/2.0'})
+        _SESSION = session
+        return _SESSION
+
+
+def _wiki_get(params):
+    """
+    GET the Wikipedia API and return the decoded JSON.
+    Responses carrying an ETag or Last-Modified are kept under WIKI_CACHE_DIR
+    and revalidated with If-None-Match / If-Modified-Since, so an unchanged
+    page comes back as a body-less 304.
+    """
+    key = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    page = _RE_NON_WORD.sub('_', str(params.get('page', '')))
+    path = os.path.join(WIKI_CACHE_DIR, f'{page}_{key}.json')
+
+    cached = None
+    try:
+        with open(path, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    resp = _http_session().get(WIKI_API, params=params, timeout=30, headers=headers)
+    if resp.status_code == 304 and cached:
+        return _json_loads(cached['body'])
+    resp.raise_for_status()
+
+    etag = resp.headers.get('ETag')
+    last_modified = resp.headers.get('Last-Modified')
+    if etag or last_modified:
+        try:
+            os.makedirs(WIKI_CACHE_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'last_modified': last_modified,
+                           'body': resp.content.decode('utf-8')}, f)
+        except OSError as e:
+            print(f'  ! Wikipedia cache write failed: {e}')
+    return _json_loads(resp.content)
+
+
+# Class-token match, same as BeautifulSoup's class_='wikitable'
+_XPATH_WIKITABLE = "//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]"
+
+
+def _cell_text(el):
+    """lxml equivalent of BeautifulSoup's get_text(strip=True)."""
+    texts = el.xpath('.//text()[not(ancestor::style or ancestor::script)]', smart_strings=False)
+    return ''.join(t.strip() for t in texts)
+
+
+def _games_day(dt):
+    """1-based day of the Games for `dt`, clamped to 1 before the opening."""
+    return max(1, (dt - GAMES_START).days + 1)
+
+
 # ── Wikipedia Medal Table Scraper ─────────────────────────────────────────
 
-def scrape_medal_table():
+def scrape_medal_table(now):
     """Fetch medal table from Wikipedia API. Returns ALL countries, not capped."""
-    import requests
-    from bs4 import BeautifulSoup
+    import lxml.html
 
     params = {
         'action': 'parse',
@@ -145,54 +259,40 @@ def scrape_medal_table():
         'prop': 'text',
         'section': 1,
     }
-    resp = requests.get(WIKI_API, params=params, timeout=30,
-                        headers={'User-Agent': 'OlympicsDashboard/2.0'})
-    resp.raise_for_status()
-    html = resp.json().get('parse', {}).get('text', {}).get('*', '')
+    html = _wiki_get(params).get('parse', {}).get('text', {}).get('*', '')
 
     if not html:
         raise ValueError('Empty Wikipedia response')
 
-    soup = BeautifulSoup(html, 'lxml')
-    table = soup.find('table', class_='wikitable')
-    if not table:
-        # Fallback: try any table
-        table = soup.find('table')
-    if not table:
+    doc = lxml.html.document_fromstring(html)
+    tables = doc.xpath(_XPATH_WIKITABLE)
+    # Fallback: try any table
+    table = tables[0] if tables else doc.find('.//table')
+    if table is None:
         raise ValueError('No table found in Wikipedia response')
 
     medals = []
-    rows = table.find_all('tr')
+    rows = table.xpath('.//tr')
 
     for row in rows:
-        cells = row.find_all(['td', 'th'])
+        cells = row.xpath('.//td | .//th')
         if len(cells) < 5:
             continue
 
-        # Extract text from each cell
-        cell_texts = []
-        for cell in cells:
-            # Get text, clean up
-            text = cell.get_text(strip=True)
-            # Remove footnote markers like [a], [1], *
-            text = re.sub(r'\[.*?\]', '', text).strip()
-            text = re.sub(r'\*$', '', text).strip()
-            cell_texts.append(text)
-
         # Find the country name — it's in the cell with an <a> tag usually
         country = None
         numbers = []
 
-        for i, cell in enumerate(cells):
-            text = cell_texts[i]
-            # Check for country link
-            link = cell.find('a')
-            if link and len(text) > 2 and not text.isdigit():
-                country = text
-            elif text.isdigit():
+        for cell in cells:
+            # Get text, remove footnote markers like [a], [1], *
+            text = _RE_CELL_NOISE.sub('', _cell_text(cell)).strip()
+            if text.isdigit():
                 numbers.append(int(text))
-            elif len(text) > 2 and not text[0].isdigit():
-                if not country:
+            elif len(text) > 2:
+                # Only look for a country link on text cells, not the medal counts
+                if cell.find('.//a') is not None:
+                    country = text
+                elif not country and not text[0].isdigit():
                     country = text
 
         # Skip totals row
@@ -205,8 +305,7 @@ def scrape_medal_table():
 
             # Normalize name
             name = country.replace('\xa0', ' ').strip()
-            flag = COUNTRY_FLAGS.get(name, '')
-            code = COUNTRY_CODES.get(name, name[:3].upper())
+            flag, code = _COUNTRY_INFO.get(name) or ('', name[:3].upper())
 
             medals.append({
                 'rank': rank,
@@ -228,8 +327,7 @@ def scrape_medal_table():
         m['rank'] = i + 1
 
     total_medals_awarded = sum(m['total'] for m in medals)
-    now = datetime.now(MST)
-    day_num = max(1, (now - GAMES_START).days + 1)
+    day_num = _games_day(now)
 
     # Estimate events complete from total medals (each event awards ~3 medals)
     events_est = total_medals_awarded // 3 if total_medals_awarded > 0 else 0
@@ -248,33 +346,15 @@ def scrape_medal_table():
 
 # ── Wikipedia Schedule/Results Scraper ────────────────────────────────────
 
-def scrape_schedule_and_results():
-    """Scrape today's schedule from Wikipedia 2026 Winter Olympics page."""
-    import requests
-    from bs4 import BeautifulSoup
-
-    now = datetime.now(MST)
-    day_num = max(1, (now - GAMES_START).days + 1)
+def scrape_schedule_and_results(now):
+    """
+    Build today's schedule row.
+    Wikipedia has no clean per-day event table, so this is a placeholder
+    pointing at the official schedule.
+    """
+    day_num = _games_day(now)
     date_str = now.strftime('%B %d').replace(' 0', ' ')  # e.g. "February 18"
 
-    # Try the main event page for schedule info
-    params = {
-        'action': 'parse',
-        'page': '2026 Winter Olympics',
-        'format': 'json',
-        'prop': 'text',
-        'section': 0,
-    }
-
-    try:
-        resp = requests.get(WIKI_API, params=params, timeout=30,
-                            headers={'User-Agent': 'OlympicsDashboard/2.0'})
-        resp.raise_for_status()
-        # We can get basic schedule info but detailed per-event schedule is hard
-        # from Wikipedia. Return a structured placeholder directing to olympics.com
-    except Exception:
-        pass
-
     # Build schedule from known Olympic event structure for the day
     # Since Wikipedia doesn't have a clean per-day event schedule table,
     # we provide a redirect to the official schedule
@@ -291,45 +371,23 @@ def scrape_schedule_and_results():
     return schedule
 
 
-def scrape_latest_results():
-    """Scrape recent medal results from Wikipedia medal table detail pages."""
-    import requests
-    from bs4 import BeautifulSoup
-
-    now = datetime.now(MST)
-    day_num = max(1, (now - GAMES_START).days + 1)
+def scrape_latest_results(now):
+    """
+    Build day tabs for the last three days.
+    Per-event results aren't scraped yet, so each day's list is empty and
+    the section shows its link to olympics.com.
+    """
     days_data = []
 
-    # Scrape from the main 2026 Winter Olympics page which has event results
     for offset in range(3):
         d = now - timedelta(days=offset)
-        d_num = max(1, (d - GAMES_START).days + 1)
+        d_num = _games_day(d)
         d_str = d.strftime('%b %d')
 
-        # Try sport-specific pages for medal results
-        results = []
-
-        # We'll try to get results from the "2026 Winter Olympics medal table" page
-        # which lists all medalists
-        if offset == 0:
-            try:
-                params = {
-                    'action': 'parse',
-                    'page': '2026 Winter Olympics medal table',
-                    'format': 'json',
-                    'prop': 'text',
-                    'section': 0,  # Intro section
-                }
-                resp = requests.get(WIKI_API, params=params, timeout=30,
-                                    headers={'User-Agent': 'OlympicsDashboard/2.0'})
-                resp.raise_for_status()
-            except Exception:
-                pass
-
         days_data.append({
             'day_num': d_num,
             'date': d_str,
-            'results': results
+            'results': []
         })
 
     return {'days': days_data}
@@ -337,51 +395,81 @@ def scrape_latest_results():
 
 # ── RSS Headlines Fetcher ─────────────────────────────────────────────────
 
-def fetch_rss_headlines():
-    """Fetch Olympic headlines from RSS feeds. No Perplexity needed."""
+RSS_FEEDS = [
+    ('https://www.nbcolympics.com/feed', 'NBC Olympics'),
+    ('https://olympics.com/en/news/rss', 'Olympics.com'),
+    ('https://www.espn.com/espn/rss/olympics/news', 'ESPN'),
+    ('https://news.google.com/rss/search?q=2026+Winter+Olympics&hl=en-US&gl=US&ceid=US:en', 'Google News'),
+]
+
+
+def _parse_feed(url):
+    """
+    Download a feed over the shared session and parse the bytes with feedparser.
+    feedparser's own fetcher has no timeout and opens a fresh connection per feed.
+    """
     import feedparser
-    import requests
 
-    headlines = []
-    feeds = [
-        ('https://www.nbcolympics.com/feed', 'NBC Olympics'),
-        ('https://olympics.com/en/news/rss', 'Olympics.com'),
-        ('https://www.espn.com/espn/rss/olympics/news', 'ESPN'),
-        ('https://news.google.com/rss/search?q=2026+Winter+Olympics&hl=en-US&gl=US&ceid=US:en', 'Google News'),
-    ]
+    # Publishers see feedparser's usual User-Agent, not the dashboard's
+    resp = _http_session().get(url, timeout=15,
+                               headers={'User-Agent': feedparser.USER_AGENT})
+    resp.raise_for_status()
+    # The URL is the base for relative entry links; the content type carries the
+    # charset, so pass it only when the server sent one
+    response_headers = {'content-location': url}
+    if resp.headers.get('content-type'):
+        response_headers['content-type'] = resp.headers['content-type']
+    return feedparser.parse(resp.content, response_headers=response_headers)
 
-    for feed_url, source_name in feeds:
-        try:
-            # feedparser handles the fetching
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries[:5]:
-                title = entry.get('title', '').strip()
-                link = entry.get('link', '#')
-                # Parse date
-                published = entry.get('published_parsed') or entry.get('updated_parsed')
-                if published:
-                    try:
-                        dt = datetime(*published[:6])
-                        date_str = dt.strftime('%b %d')
-                    except Exception:
-                        date_str = ''
-                else:
+
+def _fetch_feed_headlines(feed):
+    """Fetch one (url, source) RSS feed and return its Olympic headlines."""
+    feed_url, source_name = feed
+    headlines = []
+    try:
+        parsed = _parse_feed(feed_url)
+        for entry in parsed.entries[:5]:
+            title = entry.get('title', '').strip()
+            link = entry.get('link', '#')
+            # Parse date
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            if published:
+                try:
+                    dt = datetime(*published[:6])
+                    date_str = dt.strftime('%b %d')
+                except Exception:
                     date_str = ''
+            else:
+                date_str = ''
 
-                if title and '2026' in title.lower() or 'olympic' in title.lower() or 'winter games' in title.lower():
-                    headlines.append({
-                        'title': title[:120],
-                        'source': source_name,
-                        'url': link,
-                        'date': date_str,
-                    })
-        except Exception as e:
-            print(f'  ! RSS feed {source_name} failed: {e}')
+            title_lower = title.lower()
+            if title and ('2026' in title or 'olympic' in title_lower or 'winter games' in title_lower):
+                headlines.append({
+                    'title': title[:120],
+                    'source': source_name,
+                    'url': link,
+                    'date': date_str,
+                })
+    except Exception as e:
+        print(f'  ! RSS feed {source_name} failed: {e}')
+    return headlines
+
+
+def fetch_rss_headlines():
+    """Fetch Olympic headlines from RSS feeds. No Perplexity needed."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Feeds are independent and network-bound, so fetch them concurrently.
+    # map() keeps feed order, which the title dedup below relies on.
+    headlines = []
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as ex:
+        for feed_headlines in ex.map(_fetch_feed_headlines, RSS_FEEDS):
+            headlines.extend(feed_headlines)
 
     # If no Olympic-specific headlines, just take the top ones from Google News
     if len(headlines) < 3:
         try:
-            feed = feedparser.parse('https://news.google.com/rss/search?q=2026+Winter+Olympics+Milano+Cortina&hl=en-US&gl=US&ceid=US:en')
+            feed = _parse_feed('https://news.google.com/rss/search?q=2026+Winter+Olympics+Milano+Cortina&hl=en-US&gl=US&ceid=US:en')
             for entry in feed.entries[:10]:
                 title = entry.get('title', '').strip()
                 link = entry.get('link', '#')
@@ -402,7 +490,7 @@ def fetch_rss_headlines():
         except Exception as e:
             print(f'  ! Google News RSS fallback failed: {e}')
 
-    # Deduplicate by title similarity
+    # Deduplicate by title similarity, stopping once the 10 shown are found
     seen = set()
     unique = []
     for h in headlines:
@@ -410,30 +498,61 @@ def fetch_rss_headlines():
         if key not in seen:
             seen.add(key)
             unique.append(h)
+            if len(unique) == 10:
+                break
 
-    return {'headlines': unique[:10]}
+    return {'headlines': unique}
 
 
 # ── YouTube Data API ──────────────────────────────────────────────────────
 
+# Title keyword -> thumbnail emoji, checked in order (first hit wins)
+_SPORT_EMOJI_ITEMS = tuple({
+    'skiing': '\u26f7\ufe0f', 'ski': '\u26f7\ufe0f', 'alpine': '\u26f7\ufe0f',
+    'skating': '\u26f8\ufe0f', 'figure': '\u26f8\ufe0f', 'ice': '\u26f8\ufe0f',
+    'snowboard': '\U0001f3c2', 'halfpipe': '\U0001f3c2',
+    'hockey': '\U0001f3d2', 'biathlon': '\U0001f3af',
+    'curling': '\U0001f94c', 'bobsled': '\U0001f6f7', 'luge': '\U0001f6f7',
+    'skeleton': '\U0001f6f7', 'cross-country': '\u26f7\ufe0f',
+    'mogul': '\u26f7\ufe0f', 'freestyle': '\u26f7\ufe0f',
+}.items())
+_DEFAULT_VIDEO_EMOJI = '\U0001f3d4\ufe0f'  # Mountain
+
+
+def _medal_table_key(medal_data):
+    return hashlib.sha1(json.dumps(medal_data.get('medals', []), sort_keys=True).encode()).hexdigest()
+
+
+def _load_cached_videos(medal_key, now):
+    """Last run's videos if the medal table is unchanged and they are fresh enough."""
+    try:
+        with open(YOUTUBE_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['medal_key'] != medal_key:
+            return None
+        if now - datetime.fromisoformat(cached['fetched_at']) > YOUTUBE_CACHE_MAX_AGE:
+            return None
+        return {'videos': cached['videos']}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_videos(medal_key, now, videos):
+    try:
+        os.makedirs(os.path.dirname(YOUTUBE_CACHE_FILE), exist_ok=True)
+        with open(YOUTUBE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'medal_key': medal_key, 'fetched_at': now.isoformat(),
+                       'videos': videos['videos']}, f)
+    except OSError as e:
+        print(f'  ! YouTube cache write failed: {e}')
+
+
 def fetch_youtube_videos():
     """Fetch Olympic video highlights from YouTube Data API."""
-    import requests
-
     if not YOUTUBE_API_KEY:
         print('  ! No YOUTUBE_API_KEY, skipping YouTube fetch')
         return {'videos': []}
 
-    sport_emojis = {
-        'skiing': '\u26f7\ufe0f', 'ski': '\u26f7\ufe0f', 'alpine': '\u26f7\ufe0f',
-        'skating': '\u26f8\ufe0f', 'figure': '\u26f8\ufe0f', 'ice': '\u26f8\ufe0f',
-        'snowboard': '\U0001f3c2', 'halfpipe': '\U0001f3c2',
-        'hockey': '\U0001f3d2', 'biathlon': '\U0001f3af',
-        'curling': '\U0001f94c', 'bobsled': '\U0001f6f7', 'luge': '\U0001f6f7',
-        'skeleton': '\U0001f6f7', 'cross-country': '\u26f7\ufe0f',
-        'mogul': '\u26f7\ufe0f', 'freestyle': '\u26f7\ufe0f',
-    }
-
     try:
         params = {
             'part': 'snippet',
@@ -445,10 +564,10 @@ def fetch_youtube_videos():
             'publishedAfter': '2026-02-06T00:00:00Z',
             'relevanceLanguage': 'en',
         }
-        resp = requests.get('https://www.googleapis.com/youtube/v3/search',
-                            params=params, timeout=30)
+        resp = _http_session().get('https://www.googleapis.com/youtube/v3/search',
+                                   params=params, timeout=30)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
 
         videos = []
         for item in data.get('items', []):
@@ -468,17 +587,15 @@ def fetch_youtube_videos():
                     pass
 
             # Determine emoji based on title
-            emoji = '\U0001f3d4\ufe0f'  # Default mountain
             title_lower = title.lower()
-            for keyword, em in sport_emojis.items():
-                if keyword in title_lower:
-                    emoji = em
-                    break
+            emoji = next((em for keyword, em in _SPORT_EMOJI_ITEMS if keyword in title_lower),
+                         _DEFAULT_VIDEO_EMOJI)
 
             if video_id and title:
                 videos.append({
                     'title': title[:80],
                     'url': f'https://www.youtube.com/watch?v={video_id}',
+                    'yt_id': video_id,
                     'source': channel[:30],
                     'emoji': emoji,
                     'date': date_str,
@@ -494,40 +611,36 @@ def fetch_youtube_videos():
 
 # ── USA Breakdown (derived from medal table) ──────────────────────────────
 
-def derive_usa_breakdown(medal_data):
+def scrape_usa_sports():
     """
-    Derive USA medal breakdown by sport from Wikipedia.
-    Tries to scrape individual event results. Falls back to hardcoded.
+    Scrape the USA medal breakdown by sport from Wikipedia.
+    Returns None if the page can't be fetched or has no usable medal summary table.
     """
-    import requests
-    from bs4 import BeautifulSoup
-
     # Try to get USA-specific medal data from Wikipedia
     try:
+        import lxml.html
+
         params = {
             'action': 'parse',
             'page': 'United States at the 2026 Winter Olympics',
             'format': 'json',
             'prop': 'text',
         }
-        resp = requests.get(WIKI_API, params=params, timeout=30,
-                            headers={'User-Agent': 'OlympicsDashboard/2.0'})
-        resp.raise_for_status()
-        html = resp.json().get('parse', {}).get('text', {}).get('*', '')
+        html = _wiki_get(params).get('parse', {}).get('text', {}).get('*', '')
 
         if html:
-            soup = BeautifulSoup(html, 'lxml')
+            doc = lxml.html.document_fromstring(html)
             # Look for medal summary table
-            tables = soup.find_all('table', class_='wikitable')
+            tables = doc.xpath(_XPATH_WIKITABLE)
 
             for table in tables:
-                headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+                headers = [_cell_text(th).lower() for th in table.xpath('.//th')]
                 if 'gold' in headers or 'sport' in headers:
                     sports = []
                     total_g, total_s, total_b = 0, 0, 0
 
-                    for row in table.find_all('tr')[1:]:
-                        cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
+                    for row in table.xpath('.//tr')[1:]:
+                        cells = [_cell_text(td) for td in row.xpath('.//td | .//th')]
                         if len(cells) >= 4:
                             sport_name = cells[0]
                             nums = [int(c) for c in cells[1:] if c.isdigit()]
@@ -557,6 +670,18 @@ def derive_usa_breakdown(medal_data):
     except Exception as e:
         print(f'  ! Wikipedia USA page failed: {e}')
 
+    return None
+
+
+def derive_usa_breakdown(medal_data, usa_sports=None):
+    """
+    Derive USA medal breakdown by sport.
+    Uses the scraped Wikipedia breakdown if there is one; otherwise the
+    hardcoded breakdown with totals taken from the medal table.
+    """
+    if usa_sports:
+        return usa_sports
+
     # If we have medal table data, extract USA totals from there
     usa_entry = None
     for m in medal_data.get('medals', []):
@@ -578,10 +703,9 @@ def derive_usa_breakdown(medal_data):
 
 # ── Upcoming Events ───────────────────────────────────────────────────────
 
-def get_upcoming_events():
+def get_upcoming_events(now):
     """Build upcoming events section from known Olympic schedule structure."""
-    now = datetime.now(MST)
-    day_num = max(1, (now - GAMES_START).days + 1)
+    day_num = _games_day(now)
     days = []
 
     for offset in range(1, 4):
@@ -611,177 +735,199 @@ def get_upcoming_events():
 
 # ── HTML Generators ────────────────────────────────────────────────────────
 
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
 def html_escape(s):
-    return str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+    return str(s).translate(_HTML_ESCAPE_TABLE)
 
 
 def _extract_youtube_id(url):
     """Extract YouTube video ID from various URL formats."""
-    m = re.search(r'(?:v=|youtu\.be/|embed/|shorts/)([a-zA-Z0-9_-]{11})', url or '')
+    m = _RE_YOUTUBE_ID.search(url or '')
     return m.group(1) if m else None
 
 
+_MEDAL_ROW_TMPL = ('<tr%s><td class="rk">%s</td><td class="country-name">%s %s</td><td class="g">%s</td>'
+                   '<td class="s">%s</td><td class="b">%s</td><td class="tot">%s</td></tr>\n')
+
+
 def build_medal_table_rows(medals):
-    rows = ''
+    esc = html_escape
+    rows = []
     for m in medals.get('medals', []):
         us = ' class="us-row"' if m.get('code') == 'USA' else ''
-        flag = m.get('flag', '')
-        rows += f'<tr{us}><td class="rk">{m["rank"]}</td><td class="country-name">{flag} {html_escape(m["country"])}</td><td class="g">{m["gold"]}</td><td class="s">{m["silver"]}</td><td class="b">{m["bronze"]}</td><td class="tot">{m["total"]}</td></tr>\n'
-    return rows
+        rows.append(_MEDAL_ROW_TMPL % (us, m['rank'], m.get('flag', ''), esc(m['country']),
+                                       m['gold'], m['silver'], m['bronze'], m['total']))
+    return ''.join(rows)
+
+
+_STATUS_CLASSES = {'done': 'evt done', 'live': 'evt live-now'}
+_STATUS_BADGES = {
+    'done': '<span class="badge badge-done">FINAL</span>',
+    'live': '<span class="badge badge-live">LIVE</span>',
+    'upcoming': '<span class="badge badge-upcoming">UPCOMING</span>',
+}
 
 
 def build_schedule_rows(schedule):
+    esc = html_escape
     events = schedule.get('events', [])
     if not events:
         return '<div class="section-empty">\u23f3 Schedule data loading from official sources. <a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);">View live schedule \u2192</a></div>'
-    rows = ''
+    rows = []
     for evt in events:
         status = evt.get('status', 'upcoming')
-        is_medal = evt.get('is_medal', False)
-        classes = ['evt']
-        if status == 'done':
-            classes.append('done')
-        if status == 'live':
-            classes.append('live-now')
-        if is_medal:
-            classes.append('medal-evt')
-
-        if status == 'done':
-            badge = '<span class="badge badge-done">FINAL</span>'
-        elif status == 'live':
-            badge = '<span class="badge badge-live">LIVE</span>'
-        else:
-            badge = '<span class="badge badge-upcoming">UPCOMING</span>'
+        classes = _STATUS_CLASSES.get(status, 'evt')
+        if evt.get('is_medal'):
+            classes += ' medal-evt'
+        badge = _STATUS_BADGES.get(status, _STATUS_BADGES['upcoming'])
 
-        result = f' {html_escape(evt.get("result", ""))}' if evt.get('result') and status == 'done' else ''
+        result = f' {esc(evt.get("result", ""))}' if evt.get('result') and status == 'done' else ''
 
-        rows += f'<div class="{" ".join(classes)}"><span class="evt-time">{html_escape(evt["time_mst"])}</span><div class="evt-info"><div class="evt-name">{html_escape(evt["event"])}</div><div class="evt-detail">{badge}{result}</div></div></div>\n'
+        rows.append(f'<div class="{classes}"><span class="evt-time">{esc(evt["time_mst"])}</span><div class="evt-info"><div class="evt-name">{esc(evt["event"])}</div><div class="evt-detail">{badge}{result}</div></div></div>\n')
     # Add link to official schedule
-    rows += '<div style="text-align:center;padding:12px 0;"><a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);font-size:0.85rem;font-weight:600;">View full live schedule on Olympics.com \u2192</a></div>\n'
-    return rows
+    rows.append('<div style="text-align:center;padding:12px 0;"><a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);font-size:0.85rem;font-weight:600;">View full live schedule on Olympics.com \u2192</a></div>\n')
+    return ''.join(rows)
 
 
 def build_usa_breakdown(usa):
+    esc = html_escape
     sports = usa.get('sports', [])
     if not sports:
         return '<div class="section-empty">USA breakdown data temporarily unavailable.</div>'
-    rows = ''
+    rows = []
     for s in sports:
-        rows += f'<div class="sport-row"><span class="sport-label">{html_escape(s["sport"])}</span><div class="sport-medals"><span class="g">{s["gold"]}</span><span class="s">{s["silver"]}</span><span class="b">{s["bronze"]}</span></div></div>\n'
-    return rows
+        rows.append(f'<div class="sport-row"><span class="sport-label">{esc(s["sport"])}</span><div class="sport-medals"><span class="g">{s["gold"]}</span><span class="s">{s["silver"]}</span><span class="b">{s["bronze"]}</span></div></div>\n')
+    return ''.join(rows)
 
 
 def build_results_tabs(results):
+    esc = html_escape
     days = results.get('days', [])
     if not days or not any(d.get('results') for d in days):
         return '<div class="section-empty">\U0001f3c5 Detailed results update with each medal event. <a href="https://www.olympics.com/en/milano-cortina-2026/medals" target="_blank" style="color:var(--accent);">View full results \u2192</a></div>'
 
-    tabs = ''
-    contents = ''
+    tabs = []
+    contents = []
     for i, day in enumerate(days):
         day_id = f'd{day["day_num"]}'
         active = ' active' if i == 0 else ''
-        tabs += f'<button class="day-tab{active}" onclick="showDay(\'{day_id}\', this)">Day {day["day_num"]} ({html_escape(day["date"])})</button>\n'
+        tabs.append(f'<button class="day-tab{active}" data-day="{day_id}" onclick="showDay(\'{day_id}\', this)">Day {day["day_num"]} ({esc(day["date"])})</button>\n')
 
-        cards = ''
+        cards = []
         for r in day.get('results', []):
-            cards += f'<div class="athlete-card"><div class="athlete-top"><span class="athlete-name">\U0001f947 {html_escape(r["event"])}</span><span class="athlete-medal-tag g">Day {day["day_num"]}</span></div><div class="athlete-bio">\U0001f947 {html_escape(r["gold"])} \u2022 \U0001f948 {html_escape(r["silver"])} \u2022 \U0001f949 {html_escape(r["bronze"])}</div></div>\n'
-        contents += f'<div id="{day_id}" class="day-content{active}">\n{cards}</div>\n'
+            cards.append(f'<div class="athlete-card"><div class="athlete-top"><span class="athlete-name">\U0001f947 {esc(r["event"])}</span><span class="athlete-medal-tag g">Day {day["day_num"]}</span></div><div class="athlete-bio">\U0001f947 {esc(r["gold"])} \u2022 \U0001f948 {esc(r["silver"])} \u2022 \U0001f949 {esc(r["bronze"])}</div></div>\n')
+        contents.append(f'<div id="{day_id}" class="day-content{active}">\n{"".join(cards)}</div>\n')
 
-    return f'<div class="day-tabs">\n{tabs}</div>\n{contents}'
+    return f'<div class="day-tabs">\n{"".join(tabs)}</div>\n{"".join(contents)}'
 
 
 def build_headlines(headlines):
+    esc = html_escape
     items = headlines.get('headlines', [])
     if not items:
         return '<div class="section-empty">\U0001f4f0 Headlines temporarily unavailable. <a href="https://www.nbcolympics.com/" target="_blank" style="color:var(--accent);">Visit NBC Olympics \u2192</a></div>'
-    rows = ''
+    rows = []
     for i, h in enumerate(items, 1):
-        url = html_escape(h.get('url', '#'))
-        src = html_escape(h.get('source', ''))
-        date = html_escape(h.get('date', ''))
-        rows += f'<div class="headline-item"><span class="hl-num">{i}</span><div><div class="hl-text"><a href="{url}" target="_blank">{html_escape(h["title"])}</a></div><div class="hl-src">{src} <span class="hl-date">{date}</span></div></div></div>\n'
-    return rows
+        url = esc(h.get('url', '#'))
+        src = esc(h.get('source', ''))
+        date = esc(h.get('date', ''))
+        rows.append(f'<div class="headline-item"><span class="hl-num">{i}</span><div><div class="hl-text"><a href="{url}" target="_blank">{esc(h["title"])}</a></div><div class="hl-src">{src} <span class="hl-date">{date}</span></div></div></div>\n')
+    return ''.join(rows)
+
+
+_THUMB_GRADS = tuple(f'thumb-grad-{n}' for n in range(1, 11))
 
 
 def build_video_cards(videos):
-    grads = ['thumb-grad-1','thumb-grad-2','thumb-grad-3','thumb-grad-4','thumb-grad-5',
-             'thumb-grad-6','thumb-grad-7','thumb-grad-8','thumb-grad-9','thumb-grad-10']
+    esc = html_escape
     items = videos.get('videos', [])
     if not items:
         return '<div class="section-empty">\U0001f3ac Video highlights temporarily unavailable. <a href="https://www.youtube.com/results?search_query=2026+winter+olympics+highlights" target="_blank" style="color:var(--accent);">Search YouTube \u2192</a></div>'
-    cards = ''
+    cards = []
     for i, v in enumerate(items):
-        grad = grads[i % len(grads)]
+        grad = _THUMB_GRADS[i % len(_THUMB_GRADS)]
         emoji = v.get('emoji', '\U0001f3d4\ufe0f')
-        url = html_escape(v.get('url', '#'))
+        url = esc(v.get('url', '#'))
 
-        yt_id = _extract_youtube_id(v.get('url', ''))
+        # Set at fetch time for API results; parse the URL for anything else
+        yt_id = v.get('yt_id') or _extract_youtube_id(v.get('url', ''))
         if yt_id:
             thumb_url = f'https://img.youtube.com/vi/{yt_id}/hqdefault.jpg'
-            thumb_inner = f'<img src="{html_escape(thumb_url)}" alt="{html_escape(v["title"])}" style="width:100%;height:100%;object-fit:cover;" onerror="this.style.display=\'none\';this.nextElementSibling.style.display=\'flex\';"><div class="thumb-placeholder {grad}" style="display:none;">{emoji}</div>'
+            thumb_inner = f'<img src="{esc(thumb_url)}" alt="{esc(v["title"])}" style="width:100%;height:100%;object-fit:cover;" onerror="this.style.display=\'none\';this.nextElementSibling.style.display=\'flex\';"><div class="thumb-placeholder {grad}" style="display:none;">{emoji}</div>'
         else:
             thumb_inner = f'<div class="thumb-placeholder {grad}">{emoji}</div>'
 
-        cards += f'''<div class="video-card"><a href="{url}" target="_blank"><div class="vid-thumb">{thumb_inner}<div class="play-btn"></div></div><div class="vid-info"><div class="vid-title">{html_escape(v["title"])}</div><div class="vid-src">{html_escape(v.get("source",""))} \u2022 {html_escape(v.get("date",""))}</div></div></a></div>\n'''
-    return cards
+        cards.append(f'''<div class="video-card"><a href="{url}" target="_blank"><div class="vid-thumb">{thumb_inner}<div class="play-btn"></div></div><div class="vid-info"><div class="vid-title">{esc(v["title"])}</div><div class="vid-src">{esc(v.get("source",""))} \u2022 {esc(v.get("date",""))}</div></div></a></div>\n''')
+    return ''.join(cards)
+
+
+# Medal type -> colour class used on athlete medal tags
+_MEDAL_CLASSES = {'gold': 'g', 'silver': 's', 'bronze': 'b'}
+
+# Sport keyword -> avatar gradient class, checked in order (first hit wins)
+_SPORT_AVATAR_ITEMS = tuple({
+    'snowboard': 'avatar-snow', 'halfpipe': 'avatar-snow',
+    'speed skating': 'avatar-speed', 'speedskating': 'avatar-speed',
+    'figure skating': 'avatar-figure', 'figure': 'avatar-figure',
+    'moguls': 'avatar-moguls', 'freestyle': 'avatar-moguls',
+    'alpine': 'avatar-alpine', 'downhill': 'avatar-alpine', 'super-g': 'avatar-alpine',
+    'cross-country': 'avatar-xc', 'xc': 'avatar-xc', 'nordic': 'avatar-xc',
+    'ice dance': 'avatar-dance', 'dance': 'avatar-dance',
+}.items())
+
+
+def _avatar_class(sport):
+    sport_lower = sport.lower()
+    return next((cls for key, cls in _SPORT_AVATAR_ITEMS if key in sport_lower), 'avatar-snow')
 
 
 def build_athlete_spotlights(athletes):
-    medal_colors = {'gold': 'g', 'silver': 's', 'bronze': 'b'}
-    sport_avatars = {
-        'snowboard': 'avatar-snow', 'halfpipe': 'avatar-snow',
-        'speed skating': 'avatar-speed', 'speedskating': 'avatar-speed',
-        'figure skating': 'avatar-figure', 'figure': 'avatar-figure',
-        'moguls': 'avatar-moguls', 'freestyle': 'avatar-moguls',
-        'alpine': 'avatar-alpine', 'downhill': 'avatar-alpine', 'super-g': 'avatar-alpine',
-        'cross-country': 'avatar-xc', 'xc': 'avatar-xc', 'nordic': 'avatar-xc',
-        'ice dance': 'avatar-dance', 'dance': 'avatar-dance',
-    }
-    cards = ''
+    esc = html_escape
+    cards = []
     for a in athletes.get('athletes', []):
         name = a.get('name', '')
         sport = a.get('sport', '')
-        avatar_cls = 'avatar-snow'
-        for key, cls in sport_avatars.items():
-            if key in sport.lower():
-                avatar_cls = cls
-                break
+        avatar_cls = _avatar_class(sport)
         parts = name.split()
         initials = (parts[0][0] + parts[-1][0]).upper() if len(parts) >= 2 else name[:2].upper()
-        medal_tags = ''
-        if 'medals' in a and isinstance(a['medals'], list):
-            for m in a['medals']:
+        medals = a.get('medals')
+        if isinstance(medals, list):
+            tags = []
+            for m in medals:
                 mtype = m.get('type', 'gold')
-                color = medal_colors.get(mtype, 'g')
+                color = _MEDAL_CLASSES.get(mtype, 'g')
                 emoji = m.get('emoji', '\U0001f947')
                 event = m.get('event', '')
-                medal_tags += f'<span class="athlete-medal-tag {color}">{emoji} {html_escape(event)}</span> '
+                tags.append(f'<span class="athlete-medal-tag {color}">{emoji} {esc(event)}</span> ')
+            medal_tags = ''.join(tags)
         else:
             medal = a.get('medal', 'gold')
-            color = medal_colors.get(medal, 'g')
+            color = _MEDAL_CLASSES.get(medal, 'g')
             emoji = a.get('medal_emoji', '\U0001f947')
             medal_tags = f'<span class="athlete-medal-tag {color}">{emoji} {medal.title()}</span>'
-        cards += f'<div class="athlete-card"><div class="athlete-avatar {avatar_cls}">{initials}</div><div class="athlete-content"><div class="athlete-top"><span class="athlete-name">{html_escape(name)} &bull; {html_escape(sport)}</span>{medal_tags}</div><div class="athlete-bio">{html_escape(a.get("bio", ""))}</div></div></div>\n'
-    return cards
+        cards.append(f'<div class="athlete-card"><div class="athlete-avatar {avatar_cls}">{initials}</div><div class="athlete-content"><div class="athlete-top"><span class="athlete-name">{esc(name)} &bull; {esc(sport)}</span>{medal_tags}</div><div class="athlete-bio">{esc(a.get("bio", ""))}</div></div></div>\n')
+    return ''.join(cards)
 
 
 def build_upcoming_section(upcoming):
+    esc = html_escape
     days = upcoming.get('days', [])
     if not days:
         return '<div class="section-empty">\U0001f4c6 Upcoming events — <a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);">View full schedule \u2192</a></div>'
-    rows = ''
+    rows = []
     for day in days:
         mc = day.get('medal_count', '?')
-        rows += f'<div class="upcoming-day-hdr">\U0001f4c5 Day {day["day_num"]} \u2014 {html_escape(day["day_of_week"])}, {html_escape(day["date"])} ({mc} medal events)</div>\n'
+        rows.append(f'<div class="upcoming-day-hdr">\U0001f4c5 Day {day["day_num"]} \u2014 {esc(day["day_of_week"])}, {esc(day["date"])} ({mc} medal events)</div>\n')
         for evt in day.get('events', []):
             medal_class = ' medal' if evt.get('is_medal') else ''
             medal_icon = '\U0001f947' if evt.get('is_medal') else ''
-            iso = html_escape(evt.get('iso_date', ''))
-            name_safe = html_escape(evt['event']).replace("'", "\\'")
-            rows += f'<div class="upcoming-evt{medal_class}"><span class="ue-time">{html_escape(evt["time_mst"])}</span><span class="ue-name">{html_escape(evt["event"])}</span><span class="ue-type">{medal_icon}</span><button class="remind-btn" onclick="setReminder(this,\'{name_safe}\',\'{iso}\')">\U0001f514 Remind</button></div>\n'
-    rows += '<div style="text-align:center;padding:12px 0;"><a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);font-size:0.85rem;font-weight:600;">Full schedule on Olympics.com \u2192</a></div>\n'
-    return rows
+            iso = esc(evt.get('iso_date', ''))
+            name_safe = esc(evt['event']).replace("'", "\\'")
+            rows.append(f'<div class="upcoming-evt{medal_class}"><span class="ue-time">{esc(evt["time_mst"])}</span><span class="ue-name">{esc(evt["event"])}</span><span class="ue-type">{medal_icon}</span><button class="remind-btn" onclick="setReminder(this,\'{name_safe}\',\'{iso}\')">\U0001f514 Remind</button></div>\n')
+    rows.append('<div style="text-align:center;padding:12px 0;"><a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);font-size:0.85rem;font-weight:600;">Full schedule on Olympics.com \u2192</a></div>\n')
+    return ''.join(rows)
 
 
 def build_notifications(day_num, events_complete, total_events):
@@ -796,12 +942,11 @@ def build_notifications(day_num, events_complete, total_events):
 
 # ── Main Template ──────────────────────────────────────────────────────────
 
-def generate_html(medal_data, schedule, usa, results, headlines, videos, athletes, upcoming):
-    now = datetime.now(MST)
+def generate_html(medal_data, schedule, usa, results, headlines, videos, athletes, upcoming, now):
     timestamp = now.strftime('%a, %b %d %I:%M %p MST')
     data_date = now.strftime('%Y-%m-%d')
 
-    computed_day = max(1, (now - GAMES_START).days + 1)
+    computed_day = _games_day(now)
     raw_day = medal_data.get('day', computed_day)
     try:
         day = int(raw_day)
@@ -831,8 +976,9 @@ def generate_html(medal_data, schedule, usa, results, headlines, videos, athlete
     upcoming_rows = build_upcoming_section(upcoming)
     notif_js = build_notifications(day, events_complete, total_events)
 
-    html = TEMPLATE.format(
+    html = _render_template(dict(
         data_date=data_date,
+        build=f'{_TEMPLATE_HASH}-{data_date}',
         timestamp=timestamp,
         day=day,
         medal_today=medal_today,
@@ -851,7 +997,7 @@ def generate_html(medal_data, schedule, usa, results, headlines, videos, athlete
         athlete_cards=athlete_cards,
         upcoming_rows=upcoming_rows,
         notif_js=notif_js,
-    )
+    ))
     return html
 
 
@@ -862,7 +1008,11 @@ TEMPLATE = '''<!DOCTYPE html>
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
+<meta name="dashboard-build" content="{build}">
 <title>2026 Winter Olympics Dashboard</title>
+<link rel="preconnect" href="https://img.youtube.com">
+<link rel="dns-prefetch" href="https://www.olympics.com">
+<link rel="dns-prefetch" href="https://www.youtube.com">
 <style>
 :root {{ --bg-base: #0b1120; --bg-surface: #151d2e; --bg-card: #1a2438; --bg-muted: #243044; --text-primary: #f0f4f8; --text-secondary: #a8b8cc; --text-muted: #6b7f99; --accent: #38bdf8; --gold: #fbbf24; --silver: #c0c8d4; --bronze: #cd7f32; --red: #ef4444; --green: #22c55e; }}
 * {{ margin: 0; padding: 0; box-sizing: border-box; }}
@@ -879,12 +1029,12 @@ h1 {{ font-size: 2rem; color: var(--accent); font-weight: 800; }}
 .live-dot {{ width: 8px; height: 8px; background: var(--red); border-radius: 50%; display: inline-block; animation: blink 1.5s infinite; margin-right: 4px; }}
 @keyframes blink {{ 0%,100%{{opacity:1}} 50%{{opacity:0.3}} }}
 .stats-row {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px,1fr)); gap: 12px; margin-bottom: 20px; }}
-.stat-box {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 14px; text-align: center; }}
+.stat-box {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 14px; text-align: center; contain: layout paint style; }}
 .stat-box .label {{ font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; letter-spacing: 0.5px; }}
 .stat-box .value {{ font-size: 1.7rem; font-weight: 800; color: var(--accent); margin-top: 2px; }}
 .grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px; }}
 .grid.full {{ grid-template-columns: 1fr; }}
-.panel {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 20px; overflow-y: auto; max-height: 600px; }}
+.panel {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 20px; overflow-y: auto; max-height: 600px; contain: content; }}
 .panel.tall {{ max-height: 800px; }}
 .panel-hdr {{ font-size: 1.15rem; font-weight: 700; margin-bottom: 14px; padding-bottom: 10px; border-bottom: 1px solid var(--bg-muted); display: flex; align-items: center; gap: 8px; }}
 .section-empty {{ padding: 20px; text-align: center; color: var(--text-muted); font-size: 0.88rem; background: var(--bg-surface); border-radius: 8px; border: 1px dashed var(--bg-muted); }}
@@ -900,7 +1050,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 .country-name {{ font-weight: 600; }}
 .us-row td {{ background: rgba(56,189,248,0.08); }}
 .evt-list {{ display: flex; flex-direction: column; gap: 8px; }}
-.evt {{ background: var(--bg-surface); border-radius: 8px; padding: 10px 14px; border-left: 3px solid var(--bg-muted); display: flex; align-items: center; gap: 12px; }}
+.evt {{ background: var(--bg-surface); border-radius: 8px; padding: 10px 14px; border-left: 3px solid var(--bg-muted); display: flex; align-items: center; gap: 12px; contain: layout paint style; }}
 .evt.medal-evt {{ border-left-color: var(--gold); }}
 .evt.done {{ opacity: 0.7; }}
 .evt.live-now {{ border-left-color: var(--red); background: rgba(239,68,68,0.06); }}
@@ -925,7 +1075,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 .hl-text a:hover {{ color: var(--accent); text-decoration: underline; }}
 .hl-src {{ font-size: 0.7rem; color: var(--text-muted); margin-top: 2px; }}
 .hl-date {{ font-size: 0.7rem; color: var(--accent); opacity: 0.7; margin-left: 4px; }}
-.athlete-card {{ background: var(--bg-surface); border-radius: 8px; padding: 14px 16px; margin-bottom: 8px; display: flex; gap: 14px; align-items: flex-start; }}
+.athlete-card {{ background: var(--bg-surface); border-radius: 8px; padding: 14px 16px; margin-bottom: 8px; display: flex; gap: 14px; align-items: flex-start; contain: layout paint style; }}
 .athlete-avatar {{ width: 52px; height: 52px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 1.3rem; font-weight: 800; color: #fff; flex-shrink: 0; border: 2px solid rgba(255,255,255,0.12); text-shadow: 0 1px 3px rgba(0,0,0,0.4); position: relative; overflow: hidden; }}
 .athlete-avatar img {{ position: absolute; width: 100%; height: 100%; object-fit: cover; border-radius: 50%; top: 0; left: 0; }}
 .avatar-snow {{ background: linear-gradient(135deg, #06b6d4, #3b82f6); }}
@@ -947,7 +1097,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 .day-content {{ display: none; }}
 .day-content.active {{ display: block; }}
 .video-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(220px, 1fr)); gap: 14px; }}
-.video-card {{ background: var(--bg-surface); border-radius: 8px; overflow: hidden; border: 1px solid var(--bg-muted); transition: transform 0.2s; }}
+.video-card {{ background: var(--bg-surface); border-radius: 8px; overflow: hidden; border: 1px solid var(--bg-muted); transition: transform 0.2s; contain: layout paint style; }}
 .video-card:hover {{ transform: translateY(-2px); }}
 .video-card a {{ text-decoration: none; color: inherit; display: block; }}
 .video-card .vid-thumb {{ position: relative; width: 100%; aspect-ratio: 16/9; background: #000; overflow: hidden; }}
@@ -968,8 +1118,8 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 .video-card .vid-info {{ padding: 10px 12px; }}
 .video-card .vid-title {{ font-weight: 600; font-size: 0.82rem; line-height: 1.3; margin-bottom: 3px; }}
 .video-card .vid-src {{ color: var(--text-muted); font-size: 0.72rem; }}
-.notif-container {{ position: fixed; top: 16px; right: 16px; z-index: 1000; display: flex; flex-direction: column; gap: 10px; max-width: 360px; }}
-.notif {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 14px 18px; box-shadow: 0 8px 32px rgba(0,0,0,0.5); animation: slideIn 0.4s ease-out; cursor: pointer; position: relative; }}
+.notif-container {{ position: fixed; top: 16px; right: 16px; z-index: 1000; display: flex; flex-direction: column; gap: 10px; max-width: 360px; contain: layout style; pointer-events: none; }}
+.notif {{ background: var(--bg-card); border: 1px solid var(--bg-muted); border-radius: 10px; padding: 14px 18px; box-shadow: 0 8px 32px rgba(0,0,0,0.5); animation: slideIn 0.4s ease-out; cursor: pointer; position: relative; pointer-events: auto; }}
 .notif::before {{ content: ''; position: absolute; left: 0; top: 0; bottom: 0; width: 4px; border-radius: 10px 0 0 10px; }}
 .notif.notif-gold::before {{ background: var(--gold); }}
 .notif.notif-silver::before {{ background: var(--silver); }}
@@ -981,7 +1131,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 .remind-btn {{ background: none; border: 1px solid var(--accent); color: var(--accent); padding: 2px 8px; border-radius: 4px; cursor: pointer; font-size: 0.7rem; font-weight: 600; white-space: nowrap; flex-shrink: 0; }}
 .remind-btn:hover {{ background: var(--accent); color: #0b1120; }}
 .remind-btn.set {{ border-color: var(--green); color: var(--green); cursor: default; }}
-.upcoming-evt {{ background: var(--bg-surface); border-radius: 8px; padding: 8px 14px; margin-bottom: 6px; display: flex; align-items: center; gap: 10px; border-left: 3px solid var(--bg-muted); }}
+.upcoming-evt {{ background: var(--bg-surface); border-radius: 8px; padding: 8px 14px; margin-bottom: 6px; display: flex; align-items: center; gap: 10px; border-left: 3px solid var(--bg-muted); contain: layout paint style; }}
 .upcoming-evt.medal {{ border-left-color: var(--gold); }}
 .upcoming-evt .ue-time {{ font-size: 0.78rem; font-weight: 700; color: var(--accent); min-width: 64px; white-space: nowrap; }}
 .upcoming-evt .ue-name {{ font-weight: 600; font-size: 0.85rem; flex: 1; }}
@@ -991,6 +1141,12 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 ::-webkit-scrollbar {{ width: 6px; }}
 ::-webkit-scrollbar-track {{ background: transparent; }}
 ::-webkit-scrollbar-thumb {{ background: var(--bg-muted); border-radius: 3px; }}
+@supports (content-visibility: auto) {{
+  .headline-item {{ content-visibility: auto; contain-intrinsic-size: auto 56px; }}
+  .upcoming-evt {{ content-visibility: auto; contain-intrinsic-size: auto 40px; }}
+  .athlete-card {{ content-visibility: auto; contain-intrinsic-size: auto 110px; }}
+  .video-card {{ content-visibility: auto; contain-intrinsic-size: auto 190px; }}
+}}
 @media(max-width:1024px) {{ .grid {{ grid-template-columns: 1fr; }} }}
 @media(max-width:600px) {{ h1 {{ font-size: 1.5rem; }} .stats-row {{ grid-template-columns: 1fr 1fr; }} .header-icons {{ font-size: 2rem; }} .video-grid {{ grid-template-columns: 1fr 1fr; }} }}
 </style>
@@ -1009,7 +1165,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 <p style="font-size:0.78rem;color:var(--text-muted);margin-top:8px;"><a href="https://www.olympics.com/en/milano-cortina-2026/medals" target="_blank" style="color:var(--accent);">View live medal table &rarr;</a> &bull; <a href="https://www.olympics.com/en/milano-cortina-2026/schedule" target="_blank" style="color:var(--accent);">Live schedule &rarr;</a></p>
 </header>
 
-<div class="stats-row">
+<div class="stats-row" id="stats-row">
 <div class="stat-box"><div class="label">Medal Events Today</div><div class="value">{medal_today}</div></div>
 <div class="stat-box"><div class="label">Events Completed</div><div class="value">{events_complete}</div></div>
 <div class="stat-box"><div class="label">Total Events</div><div class="value">{total_events}</div></div>
@@ -1018,7 +1174,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 </div>
 
 <div class="grid">
-<div class="panel">
+<div class="panel" id="panel-medals">
 <div class="panel-hdr">&#x1F947; Medal Count by Country ({countries} nations)</div>
 <table>
 <thead><tr><th>Rk</th><th>Country</th><th>&#x1F947;</th><th>&#x1F948;</th><th>&#x1F949;</th><th>Tot</th></tr></thead>
@@ -1026,7 +1182,7 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 {medal_rows}</tbody>
 </table>
 </div>
-<div class="panel">
+<div class="panel" id="panel-schedule">
 <div class="panel-hdr">&#x1F4C5; Day {day} Schedule (MST)</div>
 <div class="evt-list">
 {schedule_rows}</div>
@@ -1034,21 +1190,21 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 </div>
 
 <div class="grid">
-<div class="panel">
+<div class="panel" id="panel-usa">
 <div class="panel-hdr">&#x1F1FA;&#x1F1F8; USA Medal Breakdown ({usa_total} Total)</div>
 {usa_rows}</div>
-<div class="panel">
+<div class="panel" id="panel-results">
 <div class="panel-hdr">&#x1F947; Latest Medal Results</div>
 {results_html}</div>
 </div>
 
 <div class="grid">
-<div class="panel">
+<div class="panel" id="panel-athletes">
 <div class="panel-hdr">&#x1F1FA;&#x1F1F8; USA Athlete Spotlights</div>
 <div class="evt-list">
 {athlete_cards}</div>
 </div>
-<div class="panel tall">
+<div class="panel tall" id="panel-upcoming">
 <div class="panel-hdr">&#x1F4C6; Upcoming Events &mdash; Set Reminders</div>
 <div id="upcoming-events">
 {upcoming_rows}</div>
@@ -1056,10 +1212,10 @@ tr:hover td {{ background: rgba(56,189,248,0.04); }}
 </div>
 
 <div class="grid">
-<div class="panel">
+<div class="panel" id="panel-headlines">
 <div class="panel-hdr">&#x1F4F0; Top Headlines</div>
 {headline_rows}</div>
-<div class="panel">
+<div class="panel" id="panel-videos">
 <div class="panel-hdr">&#x1F3AC; Video Highlights</div>
 <div class="video-grid">
 {video_cards}</div>
@@ -1083,14 +1239,12 @@ function getGamesDay() {{
 function updateDynamicStats() {{
   var day = getGamesDay();
   var remaining = Math.max(0, 16 - day + 1);
+  var label = new Date() > GAMES_END ? 'Games Complete' : 'Day ' + day;
+  // Look up both nodes first, then write both, so the DOM is touched in one batch
   var el = document.getElementById('stat-remaining');
-  if (el) el.textContent = remaining;
   var lbl = document.getElementById('day-label');
-  if (lbl) {{
-    var now = new Date();
-    if (now > GAMES_END) {{ lbl.textContent = 'Games Complete'; }}
-    else {{ lbl.textContent = 'Day ' + day; }}
-  }}
+  if (el) el.textContent = remaining;
+  if (lbl) lbl.textContent = label;
 }}
 updateDynamicStats();
 
@@ -1157,9 +1311,17 @@ function showNotif(n) {{
   var el = document.createElement('div');
   el.className = 'notif ' + n.type;
   el.innerHTML = '<div class="notif-title">' + n.title + '</div><div class="notif-body">' + n.body + '</div>';
-  el.onclick = function() {{ el.style.animation='fadeOut 0.3s forwards'; setTimeout(function(){{el.remove();}},300); }};
+  // Own compositor layer only while slideIn/fadeOut run, not for the 10s the notif sits still
+  el.style.willChange = 'transform, opacity';
+  el.addEventListener('animationend', function() {{ el.style.willChange = 'auto'; }});
+  function dismiss() {{
+    el.style.willChange = 'transform, opacity';
+    el.style.animation = 'fadeOut 0.3s forwards';
+    setTimeout(function(){{el.remove();}}, 300);
+  }}
+  el.onclick = dismiss;
   c.appendChild(el);
-  setTimeout(function() {{ if(el.parentNode){{ el.style.animation='fadeOut 0.3s forwards'; setTimeout(function(){{el.remove();}},300); }} }}, 10000);
+  setTimeout(function() {{ if(el.parentNode) dismiss(); }}, 10000);
 }}
 
 (function() {{
@@ -1171,20 +1333,110 @@ function showNotif(n) {{
     return;
   }}
 {notif_js}
-  medalQueue.forEach(function(n) {{ setTimeout(function(){{showNotif(n);}}, n.delay); }});
+  // One pending timer at a time; every notification due by then is appended in the same frame
+  var queue = medalQueue.slice().sort(function(a, b) {{ return a.delay - b.delay; }});
+  var t0 = Date.now();
+  (function scheduleNext() {{
+    if (!queue.length) return;
+    setTimeout(function() {{
+      requestAnimationFrame(function() {{
+        var elapsed = Date.now() - t0;
+        while (queue.length && queue[0].delay <= elapsed) showNotif(queue.shift());
+        scheduleNext();
+      }});
+    }}, Math.max(0, queue[0].delay - (Date.now() - t0)));
+  }})();
 }})();
 
-setInterval(function() {{ location.reload(); }}, 1800000);
+// Every 30 min, fetch the regenerated page and swap in only the panels that changed
+var BUILD_META = 'meta[name="dashboard-build"]';
+var LIVE_REGION_IDS = ['ts', 'stats-row', 'panel-medals', 'panel-schedule', 'panel-usa', 'panel-results',
+                       'panel-athletes', 'panel-upcoming', 'panel-headlines', 'panel-videos'];
+
+function softRefresh() {{
+  fetch(location.href.split('?')[0] + '?t=' + Date.now(), {{ cache: 'no-store' }})
+    .then(function(resp) {{ if (!resp.ok) throw new Error('HTTP ' + resp.status); return resp.text(); }})
+    .then(function(html) {{
+      var doc = new DOMParser().parseFromString(html, 'text/html');
+      // New template (CSS/JS) or a new data date, or the layout changed under us:
+      // fall back to a full reload
+      var build = doc.querySelector(BUILD_META), curBuild = document.querySelector(BUILD_META);
+      if (!build || !curBuild || build.content !== curBuild.content ||
+          !LIVE_REGION_IDS.every(function(id) {{ return doc.getElementById(id); }})) {{ location.reload(); return; }}
+      LIVE_REGION_IDS.forEach(function(id) {{
+        var cur = document.getElementById(id), next = doc.getElementById(id);
+        if (cur && cur.innerHTML !== next.innerHTML) {{
+          cur.replaceWith(next);
+          carryPanelState(cur, next);
+        }}
+      }});
+      updateDynamicStats();
+    }})
+    .catch(function(e) {{ console.warn('Dashboard refresh failed, will retry:', e); }});
+}}
+setInterval(softRefresh, 1800000);
+
+// Re-apply what the user did in a panel that was just swapped out:
+// reminders already set, and the selected results day
+function carryPanelState(cur, next) {{
+  var set = {{}};
+  cur.querySelectorAll('.remind-btn.set').forEach(function(b) {{ set[b.getAttribute('onclick')] = true; }});
+  next.querySelectorAll('.remind-btn').forEach(function(b) {{
+    if (set[b.getAttribute('onclick')]) {{
+      b.textContent = '\\u2705 Set';
+      b.classList.add('set');
+    }}
+  }});
+  var day = cur.querySelector('.day-content.active');
+  var tab = day && next.querySelector('.day-tab[data-day="' + day.id + '"]');
+  if (tab) showDay(day.id, tab);
+}}
 </script>
 </body>
 </html>'''
 
 
+def _split_template(template):
+    """Pre-parse a str.format template into (literal, field) pairs.
+
+    Adjacent literal runs (split by escaped {{ }}) are merged, so rendering is
+    one join over the ~20 real placeholders instead of a rescan of the template.
+    Placeholders must be bare {name}: format specs and conversions are ignored.
+    """
+    pairs = []
+    literal = ''
+    for text, field, _spec, _conv in Formatter().parse(template):
+        literal += text
+        if field is not None:
+            pairs.append((literal, field))
+            literal = ''
+    pairs.append((literal, None))
+    return tuple(pairs)
+
+
+_TEMPLATE_PARTS = _split_template(TEMPLATE)
+# Changes whenever the page's markup, CSS or JS does, so open tabs know to reload
+_TEMPLATE_HASH = hashlib.sha1(TEMPLATE.encode('utf-8')).hexdigest()[:12]
+
+
+def _render_template(fields):
+    out = []
+    for literal, field in _TEMPLATE_PARTS:
+        out.append(literal)
+        if field is not None:
+            out.append(str(fields[field]))
+    return ''.join(out)
+
+
 # ── Entry Point ────────────────────────────────────────────────────────────
 
 def main():
     # NO Perplexity API key required anymore
-    print(f'Starting dashboard update (v2 - no Perplexity) at {datetime.now(MST).strftime("%Y-%m-%d %H:%M MST")}')
+    # One clock reading per run, so every section agrees on the games day
+    now = datetime.now(MST)
+    print(f'Starting dashboard update (v2 - no Perplexity) at {now.strftime("%Y-%m-%d %H:%M MST")}')
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     sections = {}
 
@@ -1192,78 +1444,88 @@ def main():
     sections['athletes'] = FALLBACK_ATHLETES
     print('  \u2713 Using authoritative athlete data')
 
-    # 1. Medal table from Wikipedia (primary) with fallback
-    try:
-        sections['medals'] = scrape_medal_table()
-    except Exception as e:
-        print(f'  \u2717 Medal table scrape failed: {e}')
-        traceback.print_exc()
-        sections['medals'] = FALLBACK_MEDALS
-        print('  \u21b3 Using fallback medal data')
-
-    # Validate medal data quality
-    if len(sections['medals'].get('medals', [])) < 10:
-        print(f'  ! Only {len(sections["medals"].get("medals", []))} countries found, using fallback')
-        sections['medals'] = FALLBACK_MEDALS
+    # Sections that don't depend on the medal table are network-bound and
+    # independent, so they run concurrently while the medal table is scraped.
+    # Videos are only submitted once the medal table is known (see below).
+    # key -> (fetcher, args, label for errors, empty fallback)
+    fetchers = {
+        'schedule': (scrape_schedule_and_results, (now,), 'Schedule', {'events': []}),
+        'results': (scrape_latest_results, (now,), 'Results', {'days': []}),
+        'headlines': (fetch_rss_headlines, (), 'Headlines', {'headlines': []}),
+        'videos': (fetch_youtube_videos, (), 'Videos', {'videos': []}),
+        'upcoming': (get_upcoming_events, (now,), 'Upcoming events', {'days': []}),
+    }
 
-    # 2. USA breakdown (derived from Wikipedia or fallback)
-    try:
-        sections['usa'] = derive_usa_breakdown(sections['medals'])
-    except Exception as e:
-        print(f'  \u2717 USA breakdown failed: {e}')
-        sections['usa'] = FALLBACK_USA
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {ex.submit(fn, *args): key
+                   for key, (fn, args, _, _) in fetchers.items() if key != 'videos'}
+        # The USA page doesn't depend on the medal table, so fetch it
+        # alongside; only the fallback needs the scraped medal totals
+        usa_future = ex.submit(scrape_usa_sports)
 
-    # 3. Schedule from Wikipedia/structured data
-    try:
-        sections['schedule'] = scrape_schedule_and_results()
-    except Exception as e:
-        print(f'  \u2717 Schedule failed: {e}')
-        sections['schedule'] = {'events': []}
-
-    # 4. Latest results from Wikipedia
-    try:
-        sections['results'] = scrape_latest_results()
-    except Exception as e:
-        print(f'  \u2717 Results failed: {e}')
-        sections['results'] = {'days': []}
+        # 1. Medal table from Wikipedia (primary) with fallback
+        try:
+            sections['medals'] = scrape_medal_table(now)
+        except Exception as e:
+            print(f'  \u2717 Medal table scrape failed: {e}')
+            traceback.print_exc()
+            sections['medals'] = FALLBACK_MEDALS
+            print('  \u21b3 Using fallback medal data')
+
+        # Validate medal data quality
+        if len(sections['medals'].get('medals', [])) < 10:
+            print(f'  ! Only {len(sections["medals"].get("medals", []))} countries found, using fallback')
+            sections['medals'] = FALLBACK_MEDALS
+
+        # YouTube search costs 100 quota units; while no medals have changed,
+        # reuse the last results for up to YOUTUBE_CACHE_MAX_AGE
+        medal_key = _medal_table_key(sections['medals'])
+        cached_videos = _load_cached_videos(medal_key, now)
+        if cached_videos is not None:
+            sections['videos'] = cached_videos
+            print('  \u2713 Medal table unchanged, reusing cached YouTube results')
+        else:
+            fn, args, _, _ = fetchers['videos']
+            futures[ex.submit(fn, *args)] = 'videos'
 
-    # 5. Headlines from RSS feeds
-    try:
-        sections['headlines'] = fetch_rss_headlines()
-    except Exception as e:
-        print(f'  \u2717 Headlines failed: {e}')
-        sections['headlines'] = {'headlines': []}
+        # 2. USA breakdown (derived from Wikipedia or fallback)
+        try:
+            sections['usa'] = derive_usa_breakdown(sections['medals'], usa_future.result())
+        except Exception as e:
+            print(f'  \u2717 USA breakdown failed: {e}')
+            sections['usa'] = FALLBACK_USA
 
-    # 6. Videos from YouTube Data API
-    try:
-        sections['videos'] = fetch_youtube_videos()
-    except Exception as e:
-        print(f'  \u2717 Videos failed: {e}')
-        sections['videos'] = {'videos': []}
+        # 3-7. Schedule, results, headlines, videos, upcoming events
+        for fut in as_completed(futures):
+            key = futures[fut]
+            _, _, label, empty = fetchers[key]
+            try:
+                sections[key] = fut.result()
+            except Exception as e:
+                print(f'  \u2717 {label} failed: {e}')
+                sections[key] = empty
 
-    # 7. Upcoming events
-    try:
-        sections['upcoming'] = get_upcoming_events()
-    except Exception as e:
-        print(f'  \u2717 Upcoming events failed: {e}')
-        sections['upcoming'] = {'days': []}
+    if cached_videos is None and sections['videos'].get('videos'):
+        _save_cached_videos(medal_key, now, sections['videos'])
 
     # Generate and write HTML
     try:
         html = generate_html(
             sections['medals'], sections['schedule'], sections['usa'],
             sections['results'], sections['headlines'], sections['videos'],
-            sections['athletes'], sections['upcoming']
+            sections['athletes'], sections['upcoming'], now
         )
     except Exception as e:
         print(f'FATAL: generate_html crashed: {e}')
         traceback.print_exc()
         sys.exit(1)
 
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Encode once and write the bytes in one call; the length is the file size
+    data = html.encode('utf-8')
+    with open('index.html', 'wb') as f:
+        f.write(data)
 
-    file_size = os.path.getsize('index.html')
+    file_size = len(data)
     medal_count = len(sections['medals'].get('medals', []))
     headline_count = len(sections['headlines'].get('headlines', []))
     video_count = len(sections['videos'].get('videos', []))